@@ -22,3 +22,4 @@ ADVANTAGE_CHAR = "*"  # Suffix to identify "Star" participants
 
 # Output
 OUTPUT_FILENAME = "balanced_groups.xlsx"
+EXPORT_CACHE_SIZE = 4  # Recent Excel exports kept in memory for re-downloads
@@ -8,6 +8,7 @@ participants into balanced groups based on their scores and 'star' status.
 import math
 import sys
 import time
+import numpy as np
 from ortools.sat.python import cp_model
 from src.core import config
 
@@ -46,7 +47,10 @@ class SolutionPrinter(cp_model.CpSolverSolutionCallback):
 
 
 def solve_with_ortools(
-    participants: list[dict], num_groups: int, respect_stars: bool
+    participants: list[dict],
+    num_groups: int,
+    respect_stars: bool,
+    solver_params: dict | None = None,
 ) -> tuple[list[dict], bool]:
     """
     Solves the group partitioning problem.
@@ -59,6 +63,8 @@ def solve_with_ortools(
         participants (list[dict]): List of participant data.
         num_groups (int): Number of groups to create.
         respect_stars (bool): Whether to enforce even distribution of 'star' players.
+        solver_params (dict | None): Optional CP-SAT parameter overrides
+            (e.g. {"max_time_in_seconds": 1.0}), applied over the config defaults.
 
     Returns:
         tuple[list[dict], bool]: A tuple containing the resulting group structure
@@ -103,6 +109,11 @@ def solve_with_ortools(
     for g in range(num_groups):
         model.Add(sum(x[(i, g)] for i in range(num_people)) == group_sizes_map[g])
 
+    # Symmetry breaking: groups of the same size are interchangeable, so the
+    # first person can always be placed in the first group of their size.
+    if num_people > 0:
+        model.Add(sum(x[(0, g)] for g in {0, remainder}) == 1)
+
     if respect_stars and stars:
         max_stars_per_group = math.ceil(len(stars) / num_groups)
         min_stars_per_group = len(stars) // num_groups
@@ -134,6 +145,8 @@ def solve_with_ortools(
     solver = cp_model.CpSolver()
     solver.parameters.max_time_in_seconds = config.SOLVER_TIMEOUT
     solver.parameters.num_search_workers = config.SOLVER_NUM_WORKERS
+    for name, value in (solver_params or {}).items():
+        setattr(solver.parameters, name, value)
 
     printer = SolutionPrinter(time.time())
     status = solver.Solve(model, printer)
@@ -141,21 +154,37 @@ def solve_with_ortools(
     print("")  # Ensure newline after solution printing
 
     if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        result_groups = []
-        for g in range(num_groups):
-            group_data = {"id": g + 1, "members": [], "current_sum": 0.0, "avg": 0.0}
-            result_groups.append(group_data)
-
+        # Read the solution into a flat group index per person.
+        # Each person is in exactly one group, so stop at the first match.
+        assignment = np.zeros(num_people, dtype=np.int32)
         for i in range(num_people):
             for g in range(num_groups):
                 if solver.Value(x[(i, g)]) == 1:
-                    result_groups[g]["members"].append(participants[i])
+                    assignment[i] = g
+                    break
+
+        raw_scores = np.fromiter(
+            (float(p[config.COL_SCORE]) for p in participants),
+            dtype=np.float64,
+            count=num_people,
+        )
+        group_sums = np.bincount(assignment, weights=raw_scores, minlength=num_groups)
+        group_counts = np.bincount(assignment, minlength=num_groups)
+
+        result_groups = []
+        for g in range(num_groups):
+            count = int(group_counts[g])
+            g_sum = float(group_sums[g])
+            group_data = {
+                "id": g + 1,
+                "members": [],
+                "current_sum": g_sum,
+                "avg": g_sum / count if count > 0 else 0.0,
+            }
+            result_groups.append(group_data)
 
-        for g in result_groups:
-            g_sum = sum(float(m[config.COL_SCORE]) for m in g["members"])
-            count = len(g["members"])
-            g["current_sum"] = g_sum
-            g["avg"] = g_sum / count if count > 0 else 0.0
+        for i, g in enumerate(assignment):
+            result_groups[g]["members"].append(participants[i])
 
         return result_groups, True
     else:
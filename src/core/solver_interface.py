@@ -8,6 +8,7 @@ updates can be rendered to the Streamlit UI during execution.
 import threading
 import time
 import math
+import numpy as np
 import pandas as pd
 from ortools.sat.python import cp_model
 from src.core import config
@@ -150,11 +151,15 @@ def run_optimization(
     status = solver_inst.Solve(model, cb)
 
     if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        df = pd.DataFrame(participants)
-        df[col_group] = 0
+        # Each person is in exactly one group, so stop at the first match
+        assignment = np.zeros(num_people, dtype=np.int64)
         for i in range(num_people):
             for g in range(num_groups):
                 if solver_inst.Value(x[(i, g)]):
-                    df.at[i, col_group] = g + 1
+                    assignment[i] = g + 1
+                    break
+
+        df = pd.DataFrame(participants)
+        df[col_group] = assignment
         return df
     return None
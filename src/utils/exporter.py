@@ -8,8 +8,31 @@ and includes summary statistics in the generated Excel file.
 import pandas as pd
 import numpy as np
 import io
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from src.core import config
 from src.utils import group_helpers
 
+# Columns A-E of an empty matrix row
+_BLANK_ROW = (None,) * 5
+
+# Same look as the header pandas' to_excel gives a table
+_THIN = Side(style="thin")
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
+# Small LRU of recent exports; Streamlit re-runs the page (and this export)
+# on every interaction even when the results have not changed. Each entry
+# keeps a copy of its DataFrame so a hit can be confirmed (see _cache_key).
+_export_cache: OrderedDict[tuple, tuple[pd.DataFrame, bytes]] = OrderedDict()
+_export_cache_lock = threading.Lock()
+
 
 def generate_excel_bytes(
     df_results: pd.DataFrame, col_group: str, col_score: str, col_name: str
@@ -30,74 +53,194 @@ def generate_excel_bytes(
     Returns:
         bytes: The Excel file content as bytes.
     """
+    key = _cache_key(df_results, col_group, col_score, col_name)
+    if key is not None:
+        with _export_cache_lock:
+            entry = _export_cache.get(key)
+            if entry is not None and _same_frame(entry[0], df_results):
+                _export_cache.move_to_end(key)
+                return entry[1]
+
+    data = _build_excel_bytes(df_results, col_group, col_score, col_name)
+
+    if key is not None:
+        with _export_cache_lock:
+            _export_cache[key] = (df_results.copy(), data)
+            while len(_export_cache) > config.EXPORT_CACHE_SIZE:
+                _export_cache.popitem(last=False)
+
+    return data
+
+
+def _cache_key(
+    df_results: pd.DataFrame, col_group: str, col_score: str, col_name: str
+) -> tuple | None:
+    """
+    Builds a cache key from the DataFrame contents and the column arguments.
+
+    hash_pandas_object hashes object values by their string form, so e.g.
+    10 and '10' share a key; the key only picks a candidate entry, which
+    _same_frame then has to confirm.
+
+    Returns:
+        tuple | None: The key, or None if the DataFrame cannot be hashed.
+    """
+    if df_results is None:
+        return None
+    try:
+        row_hashes = pd.util.hash_pandas_object(df_results, index=False)
+    except TypeError:
+        # Unhashable cell values (e.g. lists); skip caching
+        return None
+    return (
+        tuple(df_results.columns),
+        row_hashes.to_numpy().tobytes(),
+        col_group,
+        col_score,
+        col_name,
+    )
+
+
+def _same_frame(cached: pd.DataFrame, df: pd.DataFrame) -> bool:
+    """
+    Checks that a cached DataFrame holds exactly the same data as df.
+
+    Args:
+        cached (pd.DataFrame): The DataFrame stored with a cache entry.
+        df (pd.DataFrame): The DataFrame being exported.
+
+    Returns:
+        bool: True if values and dtypes match, False otherwise.
+    """
+    return cached.dtypes.equals(df.dtypes) and cached.equals(df)
+
+
+def _build_excel_bytes(
+    df_results: pd.DataFrame, col_group: str, col_score: str, col_name: str
+) -> bytes:
+    """
+    Renders the Excel file for generate_excel_bytes, bypassing the cache.
+    """
     output = io.BytesIO()
 
-    # Use shared helper to get structured data
-    groups = group_helpers.aggregate_groups(df_results, col_group, col_score, col_name)
-
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
-        sheet_name = "Balanced_Groups"
-
-        if not groups:
-            pd.DataFrame().to_excel(writer, sheet_name=sheet_name)
-        else:
-            rows = []
-            for i in range(0, len(groups), 2):
-                g1 = groups[i]
-                g2 = groups[i + 1] if (i + 1) < len(groups) else None
-
-                row_header = {
-                    "A": f"GROUP {g1['id']}",
-                    "B": f"AVG: {g1['avg']:.2f}",
-                    "C": "",
-                    "D": f"GROUP {g2['id']}" if g2 else "",
-                    "E": f"AVG: {g2['avg']:.2f}" if g2 else "",
-                }
-                rows.append(row_header)
-
-                row_sub = {
-                    "A": "Name",
-                    "B": "Score",
-                    "C": "",
-                    "D": "Name" if g2 else "",
-                    "E": "Score" if g2 else "",
-                }
-                rows.append(row_sub)
-
-                len1 = len(g1["members"])
-                len2 = len(g2["members"]) if g2 else 0
-                max_len = max(len1, len2)
-
-                for k in range(max_len):
-                    m1 = g1["members"][k] if k < len1 else None
-                    m2 = g2["members"][k] if g2 and k < len2 else None
-
-                    rows.append(
-                        {
-                            "A": m1[col_name] if m1 else "",
-                            "B": m1[col_score] if m1 else "",
-                            "C": "",
-                            "D": m2[col_name] if m2 else "",
-                            "E": m2[col_score] if m2 else "",
-                        }
-                    )
-
-                rows.append({})
-
-            pd.DataFrame(rows).to_excel(
-                writer, sheet_name=sheet_name, index=False, header=False, startcol=0
+    # Use shared helper to get structured data; rows are written straight
+    # from the name/score columns, so skip the per-member dicts
+    groups = group_helpers.aggregate_groups(
+        df_results, col_group, col_score, col_name, include_members=False
+    )
+
+    # Single sheet, written row by row, so skip ExcelWriter/ExcelFormatter
+    # and stream straight into a write-only workbook.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Balanced_Groups")
+
+    if groups:
+        # All stats come from one array of group averages; the population
+        # std dev reuses the mean instead of np.std's own pass.
+        avgs = np.fromiter((g["avg"] for g in groups), np.float64, len(groups))
+        mean = avgs.mean()
+        std = np.sqrt(((avgs - mean) ** 2).mean())
+        stats = [
+            (_header_cell(ws, "Stat"), _header_cell(ws, "Val")),
+            ("Lowest", f"{avgs.min():.3f}"),
+            ("Highest", f"{avgs.max():.3f}"),
+            ("Global Avg", f"{mean:.3f}"),
+            ("StdDev", f"{std:.4f}"),
+        ]
+
+        # The stats table sits at column G, sharing rows with the matrix
+        rows = _matrix_rows(df_results, groups, col_score, col_name)
+        for matrix_row, stat_row in itertools.zip_longest(rows, stats):
+            ws.append((*(matrix_row or _BLANK_ROW), None, *(stat_row or ())))
+
+    wb.save(output)
+    return output.getvalue()
+
+
+def _matrix_rows(
+    df_results: pd.DataFrame, groups: list[dict], col_score: str, col_name: str
+) -> Iterator[tuple]:
+    """
+    Yields the side-by-side group matrix (columns A-E) one row at a time.
+
+    Args:
+        df_results (pd.DataFrame): The dataframe containing participant data.
+        groups (list[dict]): Group metadata from aggregate_groups.
+        col_score (str): Column name for Score.
+        col_name (str): Column name for Participant Name.
+
+    Yields:
+        tuple: The five cell values of the next row; None marks an empty cell.
+    """
+    # Only Name and Score are written per member, so pull those two
+    # columns as arrays instead of walking full record dicts.
+    all_names = _cell_values(df_results[col_name])
+    all_scores = _cell_values(df_results[col_score])
+    columns = [(all_names[g["indices"]], all_scores[g["indices"]]) for g in groups]
+
+    for i in range(0, len(groups), 2):
+        g1 = groups[i]
+        g2 = groups[i + 1] if (i + 1) < len(groups) else None
+        names1, scores1 = columns[i]
+        names2, scores2 = columns[i + 1] if g2 else ((), ())
+
+        yield (
+            f"GROUP {g1['id']}",
+            f"AVG: {g1['avg']:.2f}",
+            None,
+            f"GROUP {g2['id']}" if g2 else None,
+            f"AVG: {g2['avg']:.2f}" if g2 else None,
+        )
+        yield ("Name", "Score", None, "Name" if g2 else None, "Score" if g2 else None)
+
+        max_len = max(len(names1), len(names2))
+
+        for k in range(max_len):
+            has1 = k < len(names1)
+            has2 = k < len(names2)
+
+            yield (
+                names1[k] if has1 else None,
+                scores1[k] if has1 else None,
+                None,
+                names2[k] if has2 else None,
+                scores2[k] if has2 else None,
             )
 
-            avgs = [g["avg"] for g in groups]
-            if avgs:
-                stats = [
-                    {"Stat": "Lowest", "Val": f"{min(avgs):.3f}"},
-                    {"Stat": "Highest", "Val": f"{max(avgs):.3f}"},
-                    {"Stat": "Global Avg", "Val": f"{np.mean(avgs):.3f}"},
-                    {"Stat": "StdDev", "Val": f"{np.std(avgs):.4f}"},
-                ]
-                pd.DataFrame(stats).to_excel(
-                    writer, sheet_name=sheet_name, index=False, startcol=6
-                )
+        yield _BLANK_ROW
 
-    return output.getvalue()
+
+def _cell_values(col: pd.Series) -> np.ndarray:
+    """
+    Converts a column to cell values openpyxl can write.
+
+    Missing values (NaN, None, pd.NA) become None, i.e. blank cells, as
+    DataFrame.to_excel writes them; openpyxl rejects pd.NA outright.
+
+    Args:
+        col (pd.Series): The column to convert.
+
+    Returns:
+        np.ndarray: Object array of the column's values.
+    """
+    values = col.to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = None
+    return values
+
+
+def _header_cell(ws, value: str) -> WriteOnlyCell:
+    """
+    Creates a bold, bordered table header cell for a write-only worksheet.
+
+    Args:
+        ws: The write-only worksheet the cell will be appended to.
+        value (str): The header text.
+
+    Returns:
+        WriteOnlyCell: The styled cell.
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = _HEADER_FONT
+    cell.border = _HEADER_BORDER
+    cell.alignment = _HEADER_ALIGNMENT
+    return cell
@@ -5,12 +5,43 @@ This module provides shared logic for processing dataframe results into
 structured group dictionaries used by the UI and Exporter.
 """
 
+import numpy as np
 import pandas as pd
 from src.core import config
 
 
+def split_by_group(
+    group_col: pd.Series,
+) -> tuple[pd.Index, np.ndarray, list[np.ndarray]]:
+    """
+    Splits row positions by group ID using a single factorization pass.
+
+    Rows with a missing group ID are not assigned to any group.
+
+    Args:
+        group_col (pd.Series): The column holding each row's group ID.
+
+    Returns:
+        tuple[pd.Index, np.ndarray, list[np.ndarray]]: The sorted unique group
+        IDs, each row's position in that list (-1 if missing) and, for each
+        group, the positional indices of its rows.
+    """
+    codes, uniques = pd.factorize(group_col, sort=True)
+    if len(uniques) == 0:
+        return uniques, codes, []
+
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    bounds = np.searchsorted(codes[order], np.arange(1, len(uniques)))
+    return uniques, codes, np.split(order, bounds)
+
+
 def aggregate_groups(
-    df: pd.DataFrame, col_group: str, col_score: str, col_name: str
+    df: pd.DataFrame,
+    col_group: str,
+    col_score: str,
+    col_name: str,
+    include_members: bool = True,
 ) -> list[dict]:
     """
     Aggregates a DataFrame of results into a list of group metadata dictionaries.
@@ -20,10 +51,14 @@ def aggregate_groups(
         col_group (str): Column name for Group ID.
         col_score (str): Column name for Score.
         col_name (str): Column name for Participant Name.
+        include_members (bool): Whether to build the 'members' record dicts.
+            Callers that only need 'indices' can skip this, the costliest step.
 
     Returns:
         list[dict]: A list of dictionaries, where each dict represents a group
-        and contains keys: 'id', 'members', 'count', 'avg', 'stars'.
+        and contains keys: 'id', 'members', 'indices', 'count', 'avg', 'stars'.
+        'indices' holds the positional row indices of the group's members;
+        'members' is only present if include_members is True.
     """
     groups = []
     if df is None or df.empty:
@@ -33,38 +68,37 @@ def aggregate_groups(
     if col_group not in df.columns:
         return groups
 
-    unique_groups = sorted(df[col_group].unique())
-
-    for g_id in unique_groups:
-        # Convert DataFrame rows to list of dicts
-        members = df[df[col_group] == g_id].to_dict("records")
-
-        scores = []
-        stars = 0
-
-        for m in members:
-            # Safely parse scores
-            try:
-                scores.append(float(m[col_score]))
-            except (ValueError, TypeError):
-                scores.append(0.0)
-
-            # Count stars
-            val = str(m[col_name])
-            if val.endswith(config.ADVANTAGE_CHAR):
-                stars += 1
-
-        count = len(members)
-        avg = sum(scores) / count if count > 0 else 0.0
-
-        groups.append(
-            {
-                "id": g_id,
-                "members": members,
-                "count": count,
-                "avg": avg,
-                "stars": stars,
-            }
-        )
+    unique_groups, codes, group_indices = split_by_group(df[col_group])
+
+    # Parse scores once (invalid -> 0)
+    scores = pd.to_numeric(df[col_score], errors="coerce").fillna(0.0).to_numpy()
+
+    # Flag star participants once for the whole frame
+    star_mask = (
+        df[col_name]
+        .astype("string")
+        .str.endswith(config.ADVANTAGE_CHAR, na=False)
+        .to_numpy(dtype=bool)
+    )
+    star_codes = codes[star_mask]
+    star_counts = np.bincount(star_codes[star_codes >= 0], minlength=len(unique_groups))
+
+    for pos, (g_id, indices) in enumerate(zip(unique_groups, group_indices)):
+        stars = int(star_counts[pos])
+
+        count = len(indices)
+        avg = float(scores[indices].mean()) if count > 0 else 0.0
+
+        group = {
+            "id": g_id,
+            "indices": indices,
+            "count": count,
+            "avg": avg,
+            "stars": stars,
+        }
+        if include_members:
+            # Convert DataFrame rows to list of dicts
+            group["members"] = df.iloc[indices].to_dict("records")
+        groups.append(group)
 
     return groups
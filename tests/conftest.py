@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+from src.core import solver, config
+
+# Test cases are tiny; a single worker with a short cap is plenty
+TEST_SOLVER_PARAMS = {"max_time_in_seconds": 5.0, "num_search_workers": 1}
+
+
+def _make_participants(count, score=100, star_indices=None):
+    adv = config.ADVANTAGE_CHAR
+    name_col = config.COL_NAME
+    score_col = config.COL_SCORE
+    star_set = set(star_indices or ())
+    return [
+        {name_col: f"P{i}{adv if i in star_set else ''}", score_col: score}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="session")
+def make_participants():
+    """Returns a builder for participant dicts with an optional set of stars."""
+    return _make_participants
+
+
+@pytest.fixture(scope="session")
+def solve():
+    """
+    Returns a solver runner that solves each distinct case only once per session.
+    Callers must treat the returned groups as read-only.
+    """
+    cache = {}
+
+    def _solve(count, num_groups, respect_stars, score=100, star_indices=()):
+        key = (count, score, tuple(star_indices), num_groups, respect_stars)
+        if key not in cache:
+            cache[key] = solver.solve_with_ortools(
+                _make_participants(count, score=score, star_indices=star_indices),
+                num_groups=num_groups,
+                respect_stars=respect_stars,
+                solver_params=TEST_SOLVER_PARAMS,
+            )
+        return cache[key]
+
+    return _solve
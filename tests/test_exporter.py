@@ -2,14 +2,35 @@
 Unit tests for the exporter utility.
 """
 
+import pytest
 import pandas as pd
 import io
+from contextlib import closing
+from openpyxl import load_workbook
 from src.utils import exporter
 from src.core import config
 
 
-def test_generate_excel_bytes():
-    """Test that Excel generation returns bytes and contains the expected sheet."""
+def _open_workbook(data: bytes):
+    """Opens exported bytes read-only; use as a context manager to close it."""
+    return closing(
+        load_workbook(
+            io.BytesIO(data), read_only=True, data_only=True, keep_links=False
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_export_cache():
+    """Gives each test an empty export cache, so exports are rendered fresh."""
+    exporter._export_cache.clear()
+    yield
+    exporter._export_cache.clear()
+
+
+@pytest.fixture(scope="module")
+def small_excel_bytes():
+    """Export of a two-person, two-group result, generated once per module."""
     df = pd.DataFrame(
         {
             config.COL_NAME: ["A", "B"],
@@ -17,45 +38,40 @@ def test_generate_excel_bytes():
             config.COL_GROUP: [1, 2],
         }
     )
-
-    output = exporter.generate_excel_bytes(
+    return exporter.generate_excel_bytes(
         df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
     )
 
+
+def test_generate_excel_bytes(small_excel_bytes):
+    """Test that Excel generation returns bytes and contains the expected sheet."""
+    output = small_excel_bytes
+
     assert isinstance(output, bytes)
     assert len(output) > 0
 
-    with io.BytesIO(output) as f:
-        # Read the file to ensure it's valid Excel
-        xl = pd.ExcelFile(f)
-        assert "Balanced_Groups" in xl.sheet_names
+    # Read the file to ensure it's valid Excel
+    with _open_workbook(output) as wb:
+        assert "Balanced_Groups" in wb.sheetnames
 
 
-def test_generate_excel_matrix_content():
+def test_generate_excel_matrix_content(small_excel_bytes):
     """Test that the sheet contains the Matrix View structure."""
-    df = pd.DataFrame(
-        {
-            config.COL_NAME: ["A", "B"],
-            config.COL_SCORE: [10, 20],
-            config.COL_GROUP: [1, 2],
+    with _open_workbook(small_excel_bytes) as wb:
+        ws = wb["Balanced_Groups"]
+        cells = {
+            str(c)
+            for row in ws.iter_rows(values_only=True)
+            for c in row
+            if c is not None
         }
-    )
-
-    output = exporter.generate_excel_bytes(
-        df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
-    )
-
-    with io.BytesIO(output) as f:
-        # Read without headers to check raw strings
-        df_out = pd.read_excel(f, sheet_name="Balanced_Groups", header=None)
-        content = df_out.to_string()
 
-        # Verify Matrix headers exist
-        assert "GROUP 1" in content
-        assert "GROUP 2" in content
-        # Verify names exist
-        assert "A" in content
-        assert "B" in content
+    # Verify Matrix headers exist
+    assert "GROUP 1" in cells
+    assert "GROUP 2" in cells
+    # Verify names exist
+    assert "A" in cells
+    assert "B" in cells
 
 
 def test_generate_excel_odd_groups():
@@ -72,12 +88,57 @@ def test_generate_excel_odd_groups():
         df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
     )
 
-    with io.BytesIO(output) as f:
-        df_out = pd.read_excel(f, sheet_name="Balanced_Groups", header=None)
-        content = df_out.to_string()
-        assert "GROUP 1" in content
-        assert "GROUP 2" in content
-        assert "GROUP 3" in content
+    with _open_workbook(output) as wb:
+        rows = list(wb["Balanced_Groups"].iter_rows(values_only=True))
+
+    def cell(row, col):
+        return rows[row][col] if col < len(rows[row]) else None
+
+    # Groups pair up in columns A and D; the lone last group leaves D empty
+    headers = [r for r in range(len(rows)) if str(cell(r, 0)).startswith("GROUP")]
+    assert [(cell(r, 0), cell(r, 3)) for r in headers] == [
+        ("GROUP 1", "GROUP 2"),
+        ("GROUP 3", None),
+    ]
+    # The stats table runs down column G alongside the matrix rows,
+    # through the row where the lone group starts
+    assert [cell(r, 6) for r in range(5)] == [
+        "Stat",
+        "Lowest",
+        "Highest",
+        "Global Avg",
+        "StdDev",
+    ]
+    assert cell(headers[1], 6) == "StdDev"
+    assert all(cell(r, 6) is None for r in range(5, len(rows)))
+
+
+def test_generate_excel_bytes_cached():
+    """Test that identical inputs reuse the cached export and new data does not."""
+    df = pd.DataFrame(
+        {
+            config.COL_NAME: ["A", "B"],
+            config.COL_SCORE: [10, 20],
+            config.COL_GROUP: [1, 2],
+        }
+    )
+
+    assert len(exporter._export_cache) == 0
+    first = exporter.generate_excel_bytes(
+        df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
+    )
+    assert len(exporter._export_cache) == 1
+
+    second = exporter.generate_excel_bytes(
+        df.copy(), config.COL_GROUP, config.COL_SCORE, config.COL_NAME
+    )
+    assert second is first
+
+    df.loc[0, config.COL_GROUP] = 2
+    changed = exporter.generate_excel_bytes(
+        df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
+    )
+    assert changed is not first
 
 
 def test_generate_excel_empty():
@@ -88,10 +149,54 @@ def test_generate_excel_empty():
         df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
     )
 
-    with io.BytesIO(output) as f:
-        # Should contain the sheet but it should be largely empty
-        xl = pd.ExcelFile(f)
-        assert "Balanced_Groups" in xl.sheet_names
-        # Re-use xl object to parse, avoiding EOF error
-        df_out = xl.parse("Balanced_Groups")
-        assert df_out.empty
+    # Should contain the sheet but it should be empty
+    with _open_workbook(output) as wb:
+        assert "Balanced_Groups" in wb.sheetnames
+        rows = wb["Balanced_Groups"].iter_rows(values_only=True)
+        assert all(v is None for row in rows for v in row)
+
+
+def test_generate_excel_bytes_cache_hash_collision():
+    """Test that frames hashing alike (10 vs '10') do not share a cached export."""
+    ints = pd.DataFrame(
+        {
+            config.COL_NAME: ["A", "B"],
+            config.COL_SCORE: [10, "x"],
+            config.COL_GROUP: [1, 1],
+        }
+    )
+    strs = ints.assign(**{config.COL_SCORE: ["10", "x"]})
+
+    first = exporter.generate_excel_bytes(
+        ints, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
+    )
+    second = exporter.generate_excel_bytes(
+        strs, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
+    )
+    assert second is not first
+
+    with _open_workbook(second) as wb:
+        cells = list(wb["Balanced_Groups"].iter_rows(values_only=True))
+    # Row 3 holds the first member: the score must stay the string '10'
+    assert cells[2][:2] == ("A", "10")
+
+
+def test_generate_excel_missing_values():
+    """Test that missing names and scores (incl. pd.NA) export as blank cells."""
+    df = pd.DataFrame(
+        {
+            config.COL_NAME: pd.array(["A", None], dtype="string"),
+            config.COL_SCORE: [10.0, float("nan")],
+            config.COL_GROUP: [1, 1],
+        }
+    )
+
+    output = exporter.generate_excel_bytes(
+        df, config.COL_GROUP, config.COL_SCORE, config.COL_NAME
+    )
+
+    with _open_workbook(output) as wb:
+        cells = list(wb["Balanced_Groups"].iter_rows(values_only=True))
+    # Rows 3-4 hold the members; the missing ones must be empty cells
+    assert cells[2][:2] == ("A", 10)
+    assert cells[3][:2] == (None, None)
@@ -3,95 +3,75 @@ Unit tests for the solver module.
 """
 
 import pytest
+from dataclasses import dataclass
 from src.core import solver, config
 
 
-def make_participants(count, score=100, star_indices=None):
-    if star_indices is None:
-        star_indices = []
-    data = []
-    for i in range(count):
-        name = f"P{i}"
-        if i in star_indices:
-            name += config.ADVANTAGE_CHAR
-        data.append({config.COL_NAME: name, config.COL_SCORE: score})
-    return data
+def count_stars(members):
+    """Counts the star participants in a group's member list."""
+    adv = config.ADVANTAGE_CHAR
+    name_col = config.COL_NAME
+    return sum(m[name_col].endswith(adv) for m in members)
 
 
-def test_solver_basic_split():
-    participants = make_participants(10, score=100)
-    groups, success = solver.solve_with_ortools(
-        participants, num_groups=2, respect_stars=False
-    )
-    assert success is True
-    assert len(groups) == 2
-    assert groups[0]["avg"] == 100.0
-
+@dataclass(frozen=True)
+class Case:
+    """One solver scenario; every participant gets the same score."""
 
-def test_solver_unequal_sizes():
-    """Test splitting 10 people into 3 groups (4, 3, 3)."""
-    participants = make_participants(10, score=10)
-    groups, success = solver.solve_with_ortools(
-        participants, num_groups=3, respect_stars=False
-    )
-
-    assert success is True
-    sizes = sorted([len(g["members"]) for g in groups])
-    assert sizes == [3, 3, 4]
+    name: str
+    count: int
+    score: int
+    stars: tuple[int, ...]
+    num_groups: int
+    respect_stars: bool
+    expected_sizes: tuple[int, ...] | None = None
+    expected_stars: tuple[int, ...] | None = None
 
 
-def test_solver_star_constraints():
-    """Test that stars are distributed evenly."""
+CASES = (
+    # Even split of identical scores
+    Case("basic_split", 10, 100, (), 2, False, expected_sizes=(5, 5)),
+    # 10 people into 3 groups (4, 3, 3)
+    Case("unequal_sizes", 10, 10, (), 3, False, expected_sizes=(3, 3, 4)),
     # 4 stars, 6 normals -> 2 groups. Should be 2 stars per group.
-    participants = make_participants(10, score=50, star_indices=[0, 1, 2, 3])
-    groups, success = solver.solve_with_ortools(
-        participants, num_groups=2, respect_stars=True
-    )
-
-    assert success is True
-    for g in groups:
-        stars = sum(
-            1
-            for m in g["members"]
-            if str(m[config.COL_NAME]).endswith(config.ADVANTAGE_CHAR)
-        )
-        assert stars == 2
-
-
-def test_solver_impossible_stars():
-    """
-    Test behavior when stars CANNOT be perfectly even (e.g. 3 stars, 2 groups).
-    Solver should still work, distributing 2 and 1.
-    """
-    participants = make_participants(5, score=10, star_indices=[0, 1, 2])  # 3 stars
-    groups, success = solver.solve_with_ortools(
-        participants, num_groups=2, respect_stars=True
+    Case(
+        "star_constraints",
+        10,
+        50,
+        (0, 1, 2, 3),
+        2,
+        True,
+        expected_sizes=(5, 5),
+        expected_stars=(2, 2),
+    ),
+    # Stars CANNOT be perfectly even (3 stars, 2 groups): distribute 2 and 1
+    Case("impossible_stars", 5, 10, (0, 1, 2), 2, True, expected_stars=(1, 2)),
+    # Trivial case of 1 group
+    Case("single_group", 5, 100, (), 1, True, expected_sizes=(5,)),
+)
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda c: c.name)
+def test_solver_split(solve, case):
+    """Test group sizes, star distribution and averages across solver scenarios."""
+    groups, success = solve(
+        case.count,
+        num_groups=case.num_groups,
+        respect_stars=case.respect_stars,
+        score=case.score,
+        star_indices=case.stars,
     )
 
     assert success is True
-    star_counts = sorted(
-        [
-            sum(
-                1
-                for m in g["members"]
-                if str(m[config.COL_NAME]).endswith(config.ADVANTAGE_CHAR)
-            )
-            for g in groups
-        ]
-    )
-    assert star_counts == [1, 2]
-
+    assert len(groups) == case.num_groups
+    # All scores are identical, so every group average equals that score
+    assert all(g["avg"] == case.score for g in groups)
 
-def test_solver_single_group():
-    """Test trivial case of 1 group."""
-    participants = make_participants(5)
-    groups, success = solver.solve_with_ortools(
-        participants, num_groups=1, respect_stars=True
-    )
-
-    assert success is True
-    assert len(groups) == 1
-    assert len(groups[0]["members"]) == 5
+    if case.expected_sizes is not None:
+        assert tuple(sorted(len(g["members"]) for g in groups)) == case.expected_sizes
+    if case.expected_stars is not None:
+        star_counts = sorted(count_stars(g["members"]) for g in groups)
+        assert tuple(star_counts) == case.expected_stars
 
 
 def test_solver_empty_input():
@@ -109,7 +89,7 @@ def test_solver_zero_participants_positive_groups():
     assert len(groups[0]["members"]) == 0
 
 
-def test_solver_positive_participants_zero_groups():
+def test_solver_positive_participants_zero_groups(make_participants):
     """Test error when participants exist but zero groups requested."""
     participants = make_participants(5)
     with pytest.raises(ValueError):
@@ -0,0 +1,90 @@
+"""
+Unit tests for the README update tool.
+"""
+
+import fnmatch
+import pytest
+from tools import update_readme
+
+
+def _fnmatch_should_ignore(name, is_dir, patterns):
+    """The original per-pattern fnmatch loop, as the reference behaviour."""
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if is_dir and fnmatch.fnmatch(name, pattern.rstrip("/")):
+                return True
+        elif fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+
+IGNORE_PATTERNS = [
+    "venv",
+    ".git",
+    ".DS_Store",
+    "*.pyc",
+    "*.",
+    "*.tar.gz",
+    "*.py[cod]",
+    "build/",
+    "*.egg-info/",
+    "a?c",
+]
+
+IGNORE_NAMES = [
+    "venv",
+    "venv2",
+    ".git",
+    ".gitignore",
+    ".DS_Store",
+    "a.pyc",
+    ".pyc",
+    "pyc",
+    "a.pyc.bak",
+    "a.",
+    "a",
+    "a.tar.gz",
+    "tar.gz",
+    "b.gz",
+    "a.pyo",
+    "a.pyd",
+    "a.py",
+    "build",
+    "pkg.egg-info",
+    "abc",
+    "abbc",
+]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [[]] + [[p] for p in IGNORE_PATTERNS] + [IGNORE_PATTERNS],
+    ids=lambda p: "+".join(p) or "none",
+)
+def test_should_ignore_matches_fnmatch(patterns):
+    """Test that the compiled matcher agrees with the per-pattern fnmatch loop."""
+    matcher = update_readme.compile_patterns(patterns)
+
+    for name in IGNORE_NAMES:
+        for is_dir in (True, False):
+            expected = _fnmatch_should_ignore(name, is_dir, patterns)
+            assert update_readme.should_ignore(name, is_dir, matcher) == expected, (
+                name,
+                is_dir,
+            )
+
+
+def test_write_atomic_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    """Test that a failed replace leaves neither a temp file nor a changed target."""
+    target = tmp_path / "README.md"
+    target.write_text("old", encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(update_readme.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        update_readme._write_atomic(str(target), "new")
+
+    assert target.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
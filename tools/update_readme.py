@@ -7,7 +7,14 @@ It respects patterns defined in .gitignore to exclude unwanted files.
 """
 
 import os
+import re
 import fnmatch
+import functools
+from collections.abc import Iterator
+from typing import NamedTuple
+
+# Indent strings by depth, built on demand by _indent()
+_INDENT_CACHE: list[str] = []
 
 
 def load_gitignore_patterns(startpath: str) -> list[str]:
@@ -26,18 +33,107 @@ def load_gitignore_patterns(startpath: str) -> list[str]:
 
     gitignore_path = os.path.join(startpath, ".gitignore")
     if os.path.exists(gitignore_path):
+        # One bulk read and decode, then a C-level split into lines
         with open(gitignore_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and negation patterns (simple implementation)
-                # Negation patterns (starting with !) are currently ignored/skipped
-                # rather than implemented logic-wise.
-                if line and not line.startswith("#") and not line.startswith("!"):
-                    patterns.append(line)
+            lines = f.read().splitlines()
+        # Skip comments and negation patterns (simple implementation)
+        # Negation patterns (starting with !) are currently ignored/skipped
+        # rather than implemented logic-wise.
+        patterns.extend(
+            line
+            for line in map(str.strip, lines)
+            if line and not line.startswith(("#", "!"))
+        )
     return patterns
 
 
-def should_ignore(name: str, is_dir: bool, patterns: list[str]) -> bool:
+class IgnoreMatcher(NamedTuple):
+    """
+    Ignore patterns split into exact names, extensions and compiled globs
+    per entry kind.
+
+    Attributes:
+        dir_names (frozenset[str]): Wildcard-free patterns matching directories.
+        file_names (frozenset[str]): Wildcard-free patterns matching files.
+        dir_exts (frozenset[str]): Suffixes of '*.ext' patterns for directories.
+        file_exts (frozenset[str]): Suffixes of '*.ext' patterns for files.
+        dir_re (re.Pattern): Matches directory names against the other globs.
+        file_re (re.Pattern): Matches file names against the other globs
+            without a trailing '/'.
+    """
+
+    dir_names: frozenset[str]
+    file_names: frozenset[str]
+    dir_exts: frozenset[str]
+    file_exts: frozenset[str]
+    dir_re: re.Pattern
+    file_re: re.Pattern
+
+
+def compile_patterns(patterns: list[str]) -> IgnoreMatcher:
+    """
+    Compiles ignore patterns into an IgnoreMatcher for should_ignore.
+
+    Patterns without glob characters (e.g. 'venv', '.git') become a set
+    lookup, and plain extension globs (e.g. '*.pyc') a lookup of the name's
+    last suffix. The rest go through fnmatch.translate, so matching follows
+    the same rules as fnmatch.fnmatch, but all of them are tried in a single
+    regex call instead of one fnmatch call each.
+
+    Args:
+        patterns (list[str]): List of ignore patterns (glob style).
+
+    Returns:
+        IgnoreMatcher: The compiled matcher.
+    """
+    dir_names, file_names = [], []
+    dir_exts, file_exts = [], []
+    dir_globs, file_globs = [], []
+    for pattern in patterns:
+        # Directory-specific patterns (ending with /) never match files
+        # E.g. "artifacts/" matches directory "artifacts"
+        dir_only = pattern.endswith("/")
+        pattern = os.path.normcase(pattern.rstrip("/"))
+        if not any(c in pattern for c in "*?["):
+            dir_bucket, file_bucket = dir_names, file_names
+        elif pattern.startswith("*.") and not any(c in pattern[2:] for c in "*?[."):
+            # E.g. "*.pyc" matches "file.pyc": only the last suffix matters
+            pattern = pattern[2:]
+            dir_bucket, file_bucket = dir_exts, file_exts
+        else:
+            dir_bucket, file_bucket = dir_globs, file_globs
+        dir_bucket.append(pattern)
+        if not dir_only:
+            file_bucket.append(pattern)
+    return IgnoreMatcher(
+        frozenset(dir_names),
+        frozenset(file_names),
+        frozenset(dir_exts),
+        frozenset(file_exts),
+        _union_regex(dir_globs),
+        _union_regex(file_globs),
+    )
+
+
+def _union_regex(globs: list[str]) -> re.Pattern:
+    """
+    Compiles globs into a single alternation regex.
+
+    Args:
+        globs (list[str]): Glob patterns, already normcased.
+
+    Returns:
+        re.Pattern: A regex matching any of the globs ('(?!)' matches nothing).
+    """
+    if not globs:
+        return re.compile("(?!)")
+    return re.compile("|".join(fnmatch.translate(g) for g in globs))
+
+
+# Basenames like __init__.py repeat all over a tree; the matcher is part
+# of the key, so results never leak between pattern sets.
+@functools.lru_cache(maxsize=4096)
+def should_ignore(name: str, is_dir: bool, matcher: IgnoreMatcher) -> bool:
     """
     Checks if a file or directory name matches any of the ignore patterns.
 
@@ -49,25 +145,24 @@ def should_ignore(name: str, is_dir: bool, patterns: list[str]) -> bool:
     Args:
         name (str): The name of the file or directory.
         is_dir (bool): True if the name refers to a directory.
-        patterns (list[str]): List of ignore patterns (glob style).
+        matcher (IgnoreMatcher): Compiled ignore patterns.
 
     Returns:
         bool: True if the item should be ignored, False otherwise.
     """
-    for pattern in patterns:
-        # Handle directory-specific patterns (ending with /)
-        if pattern.endswith("/"):
-            if is_dir:
-                # Remove trailing slash for matching directory name
-                # E.g. "artifacts/" matches directory "artifacts"
-                if fnmatch.fnmatch(name, pattern.rstrip("/")):
-                    return True
-        else:
-            # Handle general file/name patterns
-            # E.g. "*.pyc" matches "file.pyc"
-            if fnmatch.fnmatch(name, pattern):
-                return True
-    return False
+    # normcase the same way fnmatch.fnmatch does
+    name = os.path.normcase(name)
+    if is_dir:
+        names, exts, regex = matcher.dir_names, matcher.dir_exts, matcher.dir_re
+    else:
+        names, exts, regex = matcher.file_names, matcher.file_exts, matcher.file_re
+
+    if name in names:
+        return True
+    _, dot, ext = name.rpartition(".")
+    if dot and ext in exts:
+        return True
+    return regex.match(name) is not None
 
 
 def generate_tree(startpath: str) -> str:
@@ -80,51 +175,95 @@ def generate_tree(startpath: str) -> str:
     Returns:
         str: Formatted file tree string.
     """
-    tree_lines = ["```text", "."]
+    return "\n".join(iter_tree(startpath))
 
-    # Load ignore patterns once
-    patterns = load_gitignore_patterns(startpath)
 
-    # Walk the tree
-    for root, dirs, files in os.walk(startpath):
-        # 1. Filter Directories IN-PLACE
-        # This prevents os.walk from entering ignored directories (like venv or artifacts)
-        # and removes them from the generated tree.
-        dirs[:] = [d for d in dirs if not should_ignore(d, True, patterns)]
+def iter_tree(startpath: str) -> Iterator[str]:
+    """
+    Yields the lines of the file tree (without newlines) as they are scanned.
 
-        # Sort for consistent output
-        dirs.sort()
-        files.sort()
+    Args:
+        startpath (str): Root directory to scan.
+
+    Yields:
+        str: The next line of the fenced tree block.
+    """
+    yield "```text"
+    yield "."
 
-        # 2. Filter Files
-        # Create a new list containing only non-ignored files
-        files = [f for f in files if not should_ignore(f, False, patterns)]
+    # Load and compile ignore patterns once
+    matcher = compile_patterns(load_gitignore_patterns(startpath))
+    # Drop results cached for an earlier scan's patterns
+    should_ignore.cache_clear()
 
-        # Use relpath for robust level calculation
-        try:
-            rel_path = os.path.relpath(root, startpath)
-            # If root is startpath, rel_path is '.', count of sep is 0
-            if rel_path == ".":
-                level = 0
-            else:
-                level = rel_path.count(os.sep) + 1
-        except ValueError:
-            level = 0
+    yield from _walk(startpath, 0, matcher)
 
-        indent = "│   " * level
+    yield "```"
+
+
+def _walk(path: str, level: int, matcher: IgnoreMatcher) -> Iterator[str]:
+    """
+    Yields the tree lines for one directory's contents, then recurses into
+    its subdirectories (files first, then directories, both sorted by name).
+
+    Ignored entries are filtered straight from the os.scandir listing, so
+    ignored directories (like venv or artifacts) are never opened.
+    Entries are classified from the listing's d_type without a stat call.
+    Symlinks to directories are therefore listed as files and never
+    followed, as git does, which also rules out symlink loops.
+
+    Args:
+        path (str): Directory to list.
+        level (int): Depth of the directory below the root (root is 0).
+        matcher (IgnoreMatcher): Compiled ignore patterns.
 
-        if root != startpath:
-            # Note: Connectors for directories are simplified here.
-            tree_lines.append(f"{indent}├── {os.path.basename(root)}/")
+    Yields:
+        str: The next tree line.
+    """
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # d_type from the directory listing; no extra stat call
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not should_ignore(entry.name, is_dir, matcher):
+                    (dirs if is_dir else files).append(entry)
+    except OSError:
+        # Unreadable directory: skip it, as os.walk would
+        return
+
+    # Sort for consistent output
+    dirs.sort(key=lambda e: e.name)
+    files.sort(key=lambda e: e.name)
+
+    subindent = _indent(level + 1)
+    if files:
+        for f in files[:-1]:
+            yield f"{subindent}├── {f.name}"
+        # Use '└──' for the last file if no subdirectories follow in this folder
+        tail = "├──" if dirs else "└──"
+        yield f"{subindent}{tail} {files[-1].name}"
+
+    for d in dirs:
+        # Note: Connectors for directories are simplified here.
+        yield f"{subindent}├── {d.name}/"
+        yield from _walk(d.path, level + 1, matcher)
+
+
+def _indent(level: int) -> str:
+    """
+    Returns the tree indent for the given depth, caching each depth's string.
 
-        subindent = "│   " * (level + 1)
-        for i, f in enumerate(files):
-            # Use '└──' if it's the last file and no subdirectories follow in this folder
-            connector = "└──" if i == len(files) - 1 and not dirs else "├──"
-            tree_lines.append(f"{subindent}{connector} {f}")
+    Args:
+        level (int): Depth of the line in the tree.
 
-    tree_lines.append("```")
-    return "\n".join(tree_lines)
+    Returns:
+        str: The indent prefix ('│   ' repeated level times).
+    """
+    while len(_INDENT_CACHE) <= level:
+        _INDENT_CACHE.append("│   " * len(_INDENT_CACHE))
+    return _INDENT_CACHE[level]
 
 
 def update_readme():
@@ -145,8 +284,11 @@ def update_readme():
         start_idx = content.find(start_marker)
         end_idx = content.find(end_marker)
 
-        # Check for duplicate markers
-        if content.count(start_marker) > 1 or content.count(end_marker) > 1:
+        # Check for duplicate markers by searching on past the first hit,
+        # rather than counting over the whole file
+        if (start_idx != -1 and content.find(start_marker, start_idx + 1) != -1) or (
+            end_idx != -1 and content.find(end_marker, end_idx + 1) != -1
+        ):
             print(
                 f"Error: Multiple occurrences of markers found in {readme_path}. Please resolve manually."
             )
@@ -160,8 +302,12 @@ def update_readme():
 
             new_content = f"{pre}{start_marker}\n{tree}\n{end_marker}{post}"
 
-            with open(readme_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            # Most CI runs change nothing; leave the file untouched then
+            if new_content == content:
+                print("README.md is already up to date.")
+                return
+
+            _write_atomic(readme_path, new_content)
             print("Successfully updated README.md with new project structure.")
 
         else:
@@ -196,5 +342,26 @@ def update_readme():
             )
 
 
+def _write_atomic(path: str, text: str) -> None:
+    """
+    Writes text to path via a temporary file and os.replace, so readers
+    never see a half-written file.
+
+    Args:
+        path (str): Destination file.
+        text (str): Content to write.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave the temp file behind to show up in the next tree
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 if __name__ == "__main__":
     update_readme()